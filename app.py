@@ -9,8 +9,8 @@ sys.path.append(str(Path(__file__).resolve().parent / "src"))
 
 from exchange.book import OrderBook
 from exchange.matcher import MatchingEngine
-from exchange.models import Order
-from exchange.utility import create_id, now_str
+from exchange.models import Order, Side
+from exchange.utility import next_id, now_str
 
 # -----------------------------
 # State
@@ -65,9 +65,9 @@ def handle_submit(side, price, qty, submitted, engine: MatchingEngine):
         return
 
     order = Order(
-        order_id=create_id(),
-        side=side,
-        price=price,
+        order_id=next_id(),
+        side=Side[side],
+        price=engine.book.to_ticks(price),
         qty=qty,
         timestamp=now_str()
     )
@@ -78,7 +78,7 @@ def handle_submit(side, price, qty, submitted, engine: MatchingEngine):
     st.session_state.order_log.append({
         "timestamp": order.timestamp,
         "order_id": order.order_id,
-        "side": order.side,
+        "side": order.side.name,
         "price": order.price,
         "qty": order.qty,
         "traded": len(trades) > 0
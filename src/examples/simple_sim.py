@@ -1,8 +1,9 @@
+import sys
+
 from exchange.book import OrderBook
-from exchange.matcher import MatchingEngine
-from exchange.models import Order, Trade
-from exchange.utility import create_id,now_str
-import time
+from exchange.matcher import TRADE_POOL_SIZE, MatchingEngine
+from exchange.models import BUY, SELL, Order, Trade
+from exchange.utility import next_id,now_str
 
 # ---------- Helpers ----------
 
@@ -15,7 +16,7 @@ def make_engine():
 def show_book(book: OrderBook, engine: MatchingEngine):
     print("Top of book:", engine.top_of_book())
     print("Last trade:", engine.last_trade())
-    print("Levels:", {"bids": book.get_bids(), "asks": book.get_asks()})
+    print("Levels:", book.get_aggregate_levels())
     print()
 
 
@@ -23,13 +24,14 @@ def show_book(book: OrderBook, engine: MatchingEngine):
 
 def test_add_one_order():
     engine, book = make_engine()
+    ts = now_str()  # one clock read per scenario, shared by its orders
 
     order = Order(
-        order_id=create_id(),
-        side="BUY",
+        order_id=next_id(),
+        side=BUY,
         price=100,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
 
     engine.submit_order(order)
@@ -38,26 +40,26 @@ def test_add_one_order():
 
 def test_exact_match():
     engine, book = make_engine()
+    ts = now_str()
 
     order_a = Order(
-        order_id=create_id(),
-        side="BUY",
+        order_id=next_id(),
+        side=BUY,
         price=100,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
     engine.submit_order(order_a)
     show_book(book, engine)
 
     print("----------- next order -----------\n")
-    time.sleep(1)
 
     order_b = Order(
-        order_id=create_id(),
-        side="SELL",
+        order_id=next_id(),
+        side=SELL,
         price=100,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
     engine.submit_order(order_b)
     show_book(book, engine)
@@ -65,26 +67,26 @@ def test_exact_match():
 
 def test_no_cross_two_buys():
     engine, book = make_engine()
+    ts = now_str()
 
     order_a = Order(
-        order_id=create_id(),
-        side="BUY",
+        order_id=next_id(),
+        side=BUY,
         price=100,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
     engine.submit_order(order_a)
     show_book(book, engine)
 
     print("----------- next order -----------\n")
-    time.sleep(1)
 
     order_b = Order(
-        order_id=create_id(),
-        side="BUY",
+        order_id=next_id(),
+        side=BUY,
         price=100,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
     engine.submit_order(order_b)
     show_book(book, engine)
@@ -92,20 +94,21 @@ def test_no_cross_two_buys():
 
 def test_price_priority():
     engine, book = make_engine()
+    ts = now_str()
 
     order_a = Order(
-        order_id=create_id(),
-        side="BUY",
+        order_id=next_id(),
+        side=BUY,
         price=100,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
     order_b = Order(
-        order_id=create_id(),
-        side="BUY",
+        order_id=next_id(),
+        side=BUY,
         price=110,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
 
     engine.submit_order(order_a)
@@ -117,13 +120,14 @@ def test_price_priority():
 
 def test_last_trade_price() -> int:
     engine, book = make_engine()
+    ts = now_str()
 
     order_a = Order(
-        order_id=create_id(),
-        side="BUY",
+        order_id=next_id(),
+        side=BUY,
         price=100,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
     engine.submit_order(order_a)
 
@@ -131,11 +135,11 @@ def test_last_trade_price() -> int:
     show_book(book, engine)
 
     order_b = Order(
-        order_id=create_id(),
-        side="SELL",
+        order_id=next_id(),
+        side=SELL,
         price=100,
         qty=10,
-        timestamp=now_str()
+        timestamp=ts
     )
     engine.submit_order(order_b)
 
@@ -146,9 +150,60 @@ def test_last_trade_price() -> int:
     return trade.price
 
 
+def test_sweep_crossing_levels() -> list[int]:
+    engine, book = make_engine()
+    ts = now_str()
+
+    for price in (101, 102, 103, 104, 105):
+        engine.submit_order(Order(order_id=next_id(), side=SELL, price=price, qty=10, timestamp=ts))
+
+    print("---- before sweep ----\n")
+    show_book(book, engine)
+
+    # Walk every ask a BUY at 104 would cross, emptying and removing each level
+    # as a multi-level matcher would
+    swept = []
+    for price, level in book.crossing_levels(BUY, 104):
+        while len(level):
+            level.popleft()
+        book._remove_level(SELL, price)
+        swept.append(price)
+
+    print("---- after sweep ----\n")
+    show_book(book, engine)
+
+    assert swept == [101, 102, 103, 104]
+    assert book.get_asks() == {105: 10}
+    return swept
+
+
+def test_batch_larger_than_pool():
+    engine, book = make_engine()
+    ts = now_str()
+
+    # One trade before the batch, so the batch does not start at pool slot 0
+    engine.submit_order(Order(order_id=next_id(), side=BUY, price=100, qty=10, timestamp=ts))
+    engine.submit_order(Order(order_id=next_id(), side=SELL, price=100, qty=10, timestamp=ts))
+
+    # Each BUY/SELL pair trades once, so this runs the trade pool past a full wrap
+    n_trades = TRADE_POOL_SIZE + 10
+    orders = []
+    for _ in range(n_trades):
+        orders.append(Order(order_id=next_id(), side=BUY, price=100, qty=10, timestamp=ts))
+        orders.append(Order(order_id=next_id(), side=SELL, price=100, qty=10, timestamp=ts))
+
+    trades = engine.submit_orders(orders)
+
+    assert len(trades) == n_trades
+    assert len({id(t) for t in trades}) == n_trades
+    assert [t.taker_order_id for t in trades] == [o.order_id for o in orders[1::2]]
+    assert [t.maker_order_id for t in trades] == [o.order_id for o in orders[::2]]
+    print(f"Batch of {len(orders)} orders -> {len(trades)} trades, all intact")
+
+
 # ---------- Run all ----------
 
-if __name__ == "__main__":
+def main():
     print("\n===== TEST 1: Add single order =====\n")
     test_add_one_order()
 
@@ -164,3 +219,19 @@ if __name__ == "__main__":
     print("\n===== TEST 5: Last trade price =====\n")
     price = test_last_trade_price()
     print("Returned last trade price:", price)
+
+    print("\n===== TEST 6: Sweep crossing levels =====\n")
+    swept = test_sweep_crossing_levels()
+    print("Swept ask levels:", swept)
+
+
+def run_checks():
+    """Slower regression checks; run with `python simple_sim.py --checks`."""
+    print("\n===== CHECK: Batch larger than the trade pool =====\n")
+    test_batch_larger_than_pool()
+
+
+if __name__ == "__main__":
+    main()
+    if "--checks" in sys.argv[1:]:
+        run_checks()
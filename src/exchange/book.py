@@ -1,5 +1,41 @@
-from .models import Order
+from .models import BUY, Order, Side
 from collections import deque
+from collections.abc import Iterator
+from decimal import ROUND_HALF_UP, Decimal
+from sortedcontainers import SortedDict
+
+class PriceLevel:
+    """
+    FIFO queue of resting orders at a single price, plus their total quantity.
+
+    total_qty is kept up to date on every append/popleft so aggregated views
+    can read it directly instead of summing over the orders each time.
+
+    orders is a collections.deque, which already behaves like a ring buffer:
+    it grows in fixed-size blocks, so append/popleft are O(1) and never
+    reallocate or shift the whole queue.
+    """
+
+    __slots__ = ('orders', 'total_qty')
+
+    def __init__(self):
+        self.orders: deque[Order] = deque()
+        self.total_qty: int = 0
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def append(self, order: Order) -> None:
+        """Add an order to the back of the queue."""
+        self.orders.append(order)
+        self.total_qty += order.qty
+
+    def popleft(self) -> Order:
+        """Remove and return the order at the front of the queue."""
+        order = self.orders.popleft()
+        self.total_qty -= order.qty
+        return order
+
 
 class OrderBook:
     """
@@ -7,18 +43,34 @@ class OrderBook:
 
     Data structure
     -------------
-    - _bids: dict[price -> deque[Order]]
+    - _bids: SortedDict[price -> PriceLevel]
         BUY orders keyed by price. Each price level is FIFO (deque).
-    - _asks: dict[price -> deque[Order]]
+    - _asks: SortedDict[price -> PriceLevel]
         SELL orders keyed by price. Each price level is FIFO (deque).
+    - _sides: (_bids, _asks)
+        Both sides indexed by Side, so callers can pick a side without branching.
+    - tick_size: float | str | Decimal
+        Price increment represented by one tick. All prices inside the book are
+        integer ticks; to_ticks() converts external prices once at the boundary.
+    - _best_bid_price / _best_ask_price: int | None
+        Cached top-of-book prices. Updated when a more competitive level is
+        opened, and recomputed only when a level is removed.
 
     Notes
     -----
     - This OrderBook does NOT do matching. It only stores orders and provides views.
     - FIFO within a price level is preserved by using deque.
+    - Each PriceLevel caches its total quantity, so aggregated views are
+      O(levels) rather than O(orders).
+    - Price levels are kept sorted, so when the best level is emptied the next
+      best bid/ask is an index lookup (last bid key / first ask key) rather
+      than a max()/min() scan.
 
     Public API
     ----------
+    to_ticks(price):
+        Convert an external price into integer ticks for this book.
+
     add_order(order):
         Add a new Order into the correct side (bids or asks) at its price level.
 
@@ -26,9 +78,17 @@ class OrderBook:
         Return aggregated levels:
             { price: total_quantity_at_that_price }
 
+    get_aggregate_levels():
+        Return both aggregated sides in one snapshot:
+            { 'bids': get_bids(), 'asks': get_asks() }
+
     get_raw_bids() / get_raw_asks():
-        Return raw orders grouped by price level (debug / inspection view):
-            { price: [ {order fields...}, ... ] }
+        Lazily iterate raw resting orders, best price first (debug / inspection view):
+            (price, Order), (price, Order), ...
+
+    crossing_levels(side, limit_price):
+        Lazily iterate the opposite-side levels an incoming order would cross,
+        best price first, as (price, PriceLevel).
 
     best_bid() / best_ask():
         Return the best price level as:
@@ -38,10 +98,34 @@ class OrderBook:
         Returns None if that side is empty.
     """
 
-    def __init__(self):
-        """Initialize an empty order book with no bids and no asks."""
-        self._bids = {}
-        self._asks = {}
+    __slots__ = ('tick_size', '_bids', '_asks', '_sides', '_best_bid_price', '_best_ask_price')
+
+    def __init__(self, tick_size: float | str | Decimal = 1.0):
+        """
+        Initialize an empty order book with no bids and no asks.
+
+        Args:
+            tick_size: Price increment of one tick (default 1.0, i.e. prices are
+                already whole ticks). Pass a str or Decimal (e.g. "0.01") to state
+                it exactly.
+        """
+        self.tick_size = tick_size
+        self._bids = SortedDict()
+        self._asks = SortedDict()
+        self._sides = (self._bids, self._asks)  # indexed by Side (BUY=0, SELL=1)
+        self._best_bid_price: int | None = None
+        self._best_ask_price: int | None = None
+
+    def to_ticks(self, price: float | str | Decimal) -> int:
+        """
+        Round an external price to the nearest whole number of ticks (halves round up).
+
+        The division is done in Decimal on the values' shortest str() form, so a
+        price like 1.005 with tick_size 0.01 gives 101 ticks rather than the 100
+        that float division (1.005 / 0.01 == 100.49999...) would give.
+        """
+        ticks = Decimal(str(price)) / Decimal(str(self.tick_size))
+        return int(ticks.to_integral_value(rounding=ROUND_HALF_UP))
 
     def add_order(self, order: Order) -> None:
         """
@@ -49,64 +133,62 @@ class OrderBook:
 
         - BUY orders go into _bids at their price level.
         - SELL orders go into _asks at their price level.
-        - Orders at the same price are stored FIFO using a deque.
+        - Orders at the same price are stored FIFO in a PriceLevel.
         """
-        if order.side == "BUY":
-            try:
-                self._bids[order.price].append(order)
-            except KeyError:
-                self._bids[order.price] = deque([order])
-        elif order.side == "SELL":
-            try:
-                self._asks[order.price].append(order)
-            except KeyError:
-                self._asks[order.price] = deque([order])  # price -> deque of orders
+        price = order.price
+        levels = self._sides[order.side]
+        level = levels.get(price)
+        if level is None:
+            level = levels[price] = PriceLevel()  # price -> PriceLevel
+
+            # Only a newly opened level can improve the cached top of book
+            if order.side == BUY:
+                if self._best_bid_price is None or price > self._best_bid_price:
+                    self._best_bid_price = price
+            elif self._best_ask_price is None or price < self._best_ask_price:
+                self._best_ask_price = price
+        level.append(order)
 
-    def get_raw_bids(self):
+    def _remove_level(self, side: Side, price: int) -> None:
         """
-        Return a raw, detailed snapshot of all bid orders grouped by price.
+        Remove a price level from one side and refresh that side's cached best price.
 
-        Output format:
-            { price: [ {order_id, side, price, qty, timestamp}, ... ], ... }
+        Used by the matching engine once a level has been emptied.
+        """
+        levels = self._sides[side]
+        del levels[price]
+        if side == BUY:
+            self._best_bid_price = levels.keys()[-1] if levels else None
+        else:
+            self._best_ask_price = levels.keys()[0] if levels else None
 
-        This is mainly useful for debugging/inspection.
+    def get_raw_bids(self) -> Iterator[tuple[int, Order]]:
         """
-        return {
-            price: [
-                {
-                    'order_id': o.order_id,
-                    'side': o.side,
-                    'price': o.price,
-                    'qty': o.qty,
-                    'timestamp': o.timestamp
-                }
-                for o in level
-            ]
-            for price, level in self._bids.items()
-        }
+        Lazily iterate all bid orders as (price, order), highest price first.
 
-    def get_raw_asks(self):
+        Orders within a price level are yielded in FIFO order. Nothing is
+        materialized until the generator is consumed, so this stays off the
+        hot path; it is mainly useful for debugging/inspection.
         """
-        Return a raw, detailed snapshot of all ask orders grouped by price.
+        return (
+            (price, o)
+            for price, level in reversed(self._bids.items())
+            for o in level.orders
+        )
 
-        Output format:
-            { price: [ {order_id, side, price, qty, timestamp}, ... ], ... }
-
-        This is mainly useful for debugging/inspection.
-        """
-        return {
-            price: [
-                {
-                    'order_id': o.order_id,
-                    'side': o.side,
-                    'price': o.price,
-                    'qty': o.qty,
-                    'timestamp': o.timestamp
-                }
-                for o in level
-            ]
+    def get_raw_asks(self) -> Iterator[tuple[int, Order]]:
+        """
+        Lazily iterate all ask orders as (price, order), lowest price first.
+
+        Orders within a price level are yielded in FIFO order. Nothing is
+        materialized until the generator is consumed, so this stays off the
+        hot path; it is mainly useful for debugging/inspection.
+        """
+        return (
+            (price, o)
             for price, level in self._asks.items()
-        }
+            for o in level.orders
+        )
 
     def get_bids(self):
         """
@@ -115,12 +197,7 @@ class OrderBook:
         Output format:
             { price: total_quantity_at_price, ... }
         """
-        d = {
-            price: sum(order.qty for order in level)
-            for price, level in self._bids.items()
-        }
-        return dict(sorted(d.items(), reverse=True))
-
+        return self._aggregate(reversed(self._bids.items()))
 
     def get_asks(self):
         """
@@ -129,11 +206,57 @@ class OrderBook:
         Output format:
             { price: total_quantity_at_price, ... }
         """
-        d = {
-            price: sum(order.qty for order in level)
-            for price, level in self._asks.items()
-        }
-        return dict(sorted(d.items()))
+        return self._aggregate(self._asks.items())
+
+    @staticmethod
+    def _aggregate(levels) -> dict[int, int]:
+        """
+        Collapse (price, PriceLevel) pairs into { price: total_qty }, keeping their order.
+
+        Reads each level's cached total, so this is O(levels) rather than O(orders).
+        """
+        return {price: level.total_qty for price, level in levels}
+
+    def get_aggregate_levels(self) -> dict:
+        """
+        Return a snapshot of both aggregated sides.
+
+        Output format:
+            { 'bids': { price: total_qty, ... }, 'asks': { price: total_qty, ... } }
+        """
+        return {'bids': self.get_bids(), 'asks': self.get_asks()}
+
+    def crossing_levels(self, side: Side, limit_price: int) -> Iterator[tuple[int, PriceLevel]]:
+        """
+        Iterate the opposite-side levels crossed by an order on `side` at `limit_price`.
+
+        - BUY: asks priced <= limit_price, lowest first.
+        - SELL: bids priced >= limit_price, highest first.
+
+        Each next level is looked up in the sorted price index from the last price
+        visited (O(log n) per level), with no live iterator held over the index.
+        This means the caller may empty and remove each level (e.g. via
+        _remove_level) while sweeping, as a multi-level matcher has to.
+        """
+        if side == BUY:
+            asks = self._asks
+            i = 0
+            while i < len(asks):
+                price = asks.keys()[i]
+                if price > limit_price:
+                    return
+                yield price, asks[price]
+                i = asks.bisect_right(price)
+        else:
+            bids = self._bids
+            i = len(bids) - 1
+            while i >= 0:
+                price = bids.keys()[i]
+                if price < limit_price:
+                    return
+                yield price, bids[price]
+                i = bids.bisect_left(price) - 1
+
     def get_best_bid(self) -> tuple[int, int] | None:
         """
         Return the best bid level (highest bid price).
@@ -143,18 +266,11 @@ class OrderBook:
         or:
             None if there are no bids.
         """
-        prices = self._bids.keys()
-        if len(prices) == 0:
+        highest_price = self._best_bid_price
+        if highest_price is None:
             return None
 
-        highest_price = max(prices)
-        highest_price_level = self._bids[highest_price]  # deque of orders
-
-        best_bid_quantity = 0
-        for order in highest_price_level:
-            best_bid_quantity += order.qty
-
-        return (highest_price, best_bid_quantity)
+        return (highest_price, self._bids[highest_price].total_qty)
 
     def get_best_ask(self) -> tuple[int, int] | None:
         """
@@ -165,15 +281,8 @@ class OrderBook:
         or:
             None if there are no asks.
         """
-        prices = self._asks.keys()
-        if len(prices) == 0:
+        lowest_price = self._best_ask_price
+        if lowest_price is None:
             return None
 
-        lowest_price = min(prices)
-        lowest_price_level = self._asks[lowest_price]  # deque of orders
-
-        best_ask_quantity = 0
-        for order in lowest_price_level:
-            best_ask_quantity += order.qty
-
-        return (lowest_price, best_ask_quantity)
+        return (lowest_price, self._asks[lowest_price].total_qty)
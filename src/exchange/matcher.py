@@ -1,6 +1,10 @@
-from .models import Order, Trade
+from collections.abc import Iterable
+from .models import BUY, Order, Trade
 from .book import OrderBook
-from collections import deque
+
+# Trades are kept in a ring of at most this many objects (size must be a power of 2)
+TRADE_POOL_SIZE = 1 << 16
+_TRADE_POOL_MASK = TRADE_POOL_SIZE - 1
 
 class MatchingEngine:
     """
@@ -15,17 +19,24 @@ class MatchingEngine:
     - If prices cross but quantity does not match exactly, the order is added to the book
       (no partial fills are implemented yet).
     - After a trade, the filled resting order is removed from the book.
-    - Tracks the most recent trade in _last_trade.
+    - Trade objects come from a pool that grows on demand up to TRADE_POOL_SIZE;
+      after that its slots are reused, so a match no longer allocates a Trade (the
+      returned list is still new). Callers that keep trades longer than that must
+      copy them out.
+    - The pool doubles as the trade history: last_trade() / recent_trades(k) read
+      the most recent entries straight from it.
 
     Notes / Limitations
     -------------------
     - No partial fills
     - No multi-order sweeping (does not walk the book)
-    - No time priority beyond FIFO within a single price level (deque)
-    - Directly accesses book internals (_bids/_asks), which is OK for a toy engine but
+    - No time priority beyond FIFO within a single price level (PriceLevel)
+    - Directly accesses book internals (_sides, cached best prices), which is OK for a toy engine but
       should be encapsulated later
     """
 
+    __slots__ = ('book', '_trade_pool', '_trade_idx')
+
     def __init__(self, book: OrderBook):
         """
         Initialize the matching engine.
@@ -33,8 +44,9 @@ class MatchingEngine:
         Args:
             book: The OrderBook instance this engine will read from and write to.
         """
-        self._last_trade: Trade | None = None
         self.book: OrderBook = book
+        self._trade_pool: list[Trade] = []  # filled lazily, see submit_order
+        self._trade_idx: int = 0
 
     def submit_order(self, order: Order) -> list[Trade]:
         """
@@ -46,100 +58,89 @@ class MatchingEngine:
         Returns:
             A list of executed trades (empty list if no trade occurs).
             Current implementation returns either [] or [trade].
+
+            The Trade objects are slots of the engine's trade pool, not copies:
+            each one is overwritten in place once TRADE_POOL_SIZE further trades
+            have executed. Copy out any trade you need to keep beyond that.
+        """
+        book = self.book
+        side = order.side
+
+        # One path serves both sides on purpose: per-side specialized submit
+        # functions behind a dispatch table were measured no faster, since the
+        # extra call costs more than the single int comparison on side below.
+
+        # A BUY matches against the best (lowest) ask, a SELL against the best
+        # (highest) bid; both are cached on the book
+        if side == BUY:
+            best_price = book._best_ask_price
+            crosses = best_price is not None and order.price >= best_price
+        else:
+            best_price = book._best_bid_price
+            crosses = best_price is not None and order.price <= best_price
+
+        # If the opposite side is empty or the order does not cross, add it to the book
+        if not crosses:
+            book.add_order(order)
+            return []
+
+        opposite_side = 1 - side
+        best_level = book._sides[opposite_side][best_price]
+        best_order: Order = best_level.orders[0]  # FIFO at this price
+
+        # Crossed but not equal quantity -> do not match in this version
+        # (no partial fills yet)
+        if order.qty != best_order.qty:
+            book.add_order(order)
+            return []
+
+        trade_idx = self._trade_idx
+        if trade_idx < TRADE_POOL_SIZE:
+            # Pool not full yet: allocate and keep the trade
+            trade = Trade(best_price, order.qty, order.order_id, best_order.order_id)
+            self._trade_pool.append(trade)
+        else:
+            # Pool full: reuse the oldest slot instead of allocating a new Trade
+            trade = self._trade_pool[trade_idx & _TRADE_POOL_MASK]
+            trade.price = best_price
+            trade.qty = order.qty
+            trade.taker_order_id = order.order_id
+            trade.maker_order_id = best_order.order_id
+        self._trade_idx = trade_idx + 1
+
+        best_level.popleft()  # remove filled resting order
+
+        # If the price level is now empty, remove it from the book
+        if len(best_level) == 0:
+            book._remove_level(opposite_side, best_price)
+
+        return [trade]
+
+    def submit_orders(self, orders: Iterable[Order]) -> list[Trade]:
+        """
+        Submit a batch of orders in sequence, e.g. when replaying a recorded session.
+
+        Equivalent to calling submit_order() on each order in turn.
+
+        Returns:
+            All trades executed by the batch, in execution order. As with
+            submit_order(), these are pooled Trade objects. The exception is a batch
+            that runs past TRADE_POOL_SIZE trades: each trade is copied out just
+            before its pool slot is reused, so every entry of the result stays
+            correct.
         """
-        if order.side == "BUY":
-            # BUY order matches against the best ask (lowest ask price)
-            best_ask = self.book.get_best_ask()
-
-            # If no asks exist, place the order in the book
-            if best_ask is None:
-                self.book.add_order(order)
-                return []
-
-            best_ask_price = best_ask[0]
-
-            # If the BUY price crosses the ask, attempt to match
-            if order.price >= best_ask_price:
-                best_ask_level: deque = self.book._asks[best_ask_price]
-                best_ask_order: Order = best_ask_level[0]  # FIFO at this price
-
-                # Only match if quantities are exactly equal (no partial fills yet)
-                if order.qty == best_ask_order.qty:
-                    taker_order_id = order.order_id
-                    maker_order_id = best_ask_order.order_id
-
-                    trade = Trade(
-                        price=best_ask_order.price,
-                        qty=order.qty,
-                        taker_order_id=taker_order_id,
-                        maker_order_id=maker_order_id
-                    )
-
-                    self._last_trade = trade
-                    best_ask_level.popleft()  # remove filled resting order
-
-                else:
-                    # Crossed but not equal quantity -> do not match in this version
-                    self.book.add_order(order)
-                    return []
-
-                # If the price level is now empty, remove it from the book
-                if len(best_ask_level) == 0:
-                    del self.book._asks[best_ask_price]
-
-                return [trade]
-
-            # If the BUY does not cross, add to book
-            elif order.price < best_ask_price:
-                self.book.add_order(order)
-                return []
-
-        elif order.side == "SELL":
-            # SELL order matches against the best bid (highest bid price)
-            best_bid = self.book.get_best_bid()
-
-            # If no bids exist, place the order in the book
-            if best_bid is None:
-                self.book.add_order(order)
-                return []
-
-            best_bid_price = best_bid[0]
-
-            # If the SELL price crosses the bid, attempt to match
-            if order.price <= best_bid_price:
-                best_bid_level: deque = self.book._bids[best_bid_price]
-                best_bid_order: Order = best_bid_level[0]  # FIFO at this price
-
-                # Only match if quantities are exactly equal (no partial fills yet)
-                if order.qty == best_bid_order.qty:
-                    taker_order_id = order.order_id
-                    maker_order_id = best_bid_order.order_id
-
-                    trade = Trade(
-                        price=best_bid_price,
-                        qty=order.qty,
-                        taker_order_id=taker_order_id,
-                        maker_order_id=maker_order_id
-                    )
-
-                    self._last_trade = trade
-                    best_bid_level.popleft()  # remove filled resting order
-
-                else:
-                    # Crossed but not equal quantity -> do not match in this version
-                    self.book.add_order(order)
-                    return []
-
-                # If the price level is now empty, remove it from the book
-                if len(best_bid_level) == 0:
-                    del self.book._bids[best_bid_price]
-
-                return [trade]
-
-            # If the SELL does not cross, add to book
-            elif order.price > best_bid_price:
-                self.book.add_order(order)
-                return []
+        submit = self.submit_order
+        trades: list[Trade] = []
+        copied = 0
+        for order in orders:
+            # submit_order executes at most one trade, which reuses the pool slot of
+            # trades[-TRADE_POOL_SIZE] once the batch fills the pool; copy it first
+            if len(trades) - copied >= TRADE_POOL_SIZE:
+                t = trades[copied]
+                trades[copied] = Trade(t.price, t.qty, t.taker_order_id, t.maker_order_id)
+                copied += 1
+            trades.extend(submit(order))
+        return trades
 
     def top_of_book(self) -> dict:
         """
@@ -156,8 +157,29 @@ class MatchingEngine:
             'ask': self.book.get_best_ask()
         }
 
-    def last_trade(self):
+    def last_trade(self) -> Trade | None:
         """
         Return the most recent Trade executed by this engine, or None if no trades.
         """
-        return self._last_trade
+        if self._trade_idx == 0:
+            return None
+        return self._trade_pool[(self._trade_idx - 1) & _TRADE_POOL_MASK]
+
+    def recent_trades(self, k: int) -> list[Trade]:
+        """
+        Return up to the last k trades, oldest first.
+
+        At most TRADE_POOL_SIZE trades are retained; older ones have been reused.
+        The list holds live pool objects rather than a snapshot: once the pool has
+        wrapped, each later trade overwrites the oldest of them in place. Copy the
+        trades if you need them to stay fixed.
+        """
+        k = min(k, self._trade_idx, TRADE_POOL_SIZE)
+        if k <= 0:
+            return []
+
+        start = (self._trade_idx - k) & _TRADE_POOL_MASK
+        end = start + k
+        if end <= TRADE_POOL_SIZE:
+            return self._trade_pool[start:end]
+        return self._trade_pool[start:] + self._trade_pool[:end - TRADE_POOL_SIZE]
@@ -1,9 +1,15 @@
 from dataclasses import dataclass
-from typing import Literal
+from enum import IntEnum
 
-Side = Literal['BUY',"SELL"]
+class Side(IntEnum):
+    BUY = 0
+    SELL = 1
 
-@dataclass
+# Sides are small ints so they can index per-side tables (e.g. OrderBook._sides)
+BUY = Side.BUY
+SELL = Side.SELL
+
+@dataclass(slots=True)
 class Order: 
     order_id: int
     side: Side
@@ -11,7 +17,13 @@ class Order:
     qty: int
     timestamp: str
 
-@dataclass
+    def __post_init__(self):
+        # Prices are integer ticks; convert at the boundary with OrderBook.to_ticks()
+        # (exact type check, so bools and other int subclasses are rejected too)
+        if type(self.price) is not int:
+            raise TypeError(f"Order price must be an int number of ticks, got {self.price!r}")
+
+@dataclass(slots=True)
 class Trade: 
     price: int
     qty: int
@@ -1,8 +1,11 @@
-from random import randint
 from datetime import datetime
+from itertools import count
 
-def create_id() -> int: 
-    return randint(1,10**9)
+_order_ids = count(1)
+
+def next_id() -> int:
+    """Return the next order id: a process-wide, monotonically increasing int."""
+    return next(_order_ids)
 
 def now_str() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")